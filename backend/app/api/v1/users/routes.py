@@ -2,8 +2,9 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body
 from sqlalchemy.orm import Session
 from app.core.deps import get_db, get_current_active_user
-from app.core.security import verify_password, get_password_hash
+from app.core.security import verify_password_async, get_password_hash_async
 from app.core.permissions import Permission, require_permission, require_admin
+from app.core.responses import ModelJSONResponse
 from app.models.user import User, UserRole
 from app.models.enums import UserRole
 from app.repositories.user import UserRepository
@@ -37,6 +38,10 @@ router = APIRouter()
 user_repository = UserRepository(User)
 user_service = UserService(user_repository)
 
+def _user_response(user: User) -> ModelJSONResponse:
+    """Build a user's response, serialized in one pass by pydantic-core."""
+    return ModelJSONResponse(UserResponse.from_user(user))
+
 @router.get("/me", response_model=UserResponse)
 @require_permission(Permission.API_ACCESS)
 async def read_user_me(
@@ -45,9 +50,7 @@ async def read_user_me(
     db: Session = Depends(get_db)
 ):
     """Get current user's data."""
-    user_dict = current_user.__dict__.copy()
-    user_dict["permissions"] = current_user.get_permissions()
-    return user_dict
+    return _user_response(current_user)
 
 @router.get("/{user_id}", response_model=UserResponse)
 @require_permission(Permission.READ_USERS)
@@ -70,9 +73,7 @@ async def read_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    user_dict = user.__dict__.copy()
-    user_dict["permissions"] = user.get_permissions()
-    return user_dict
+    return _user_response(user)
 
 @router.put("/me", response_model=UserResponse)
 @require_permission(Permission.API_ACCESS)
@@ -122,13 +123,16 @@ async def update_password(
 ):
     """Update current user's password."""
     current_password_obj = user_repository.get_current_password(db, current_user.id)
-    if not current_password_obj or not verify_password(password_update.current_password, current_password_obj.hashed_password):
+    # Password hashing is CPU-bound; keep it off the event loop
+    if not current_password_obj or not await verify_password_async(
+        password_update.current_password, current_password_obj.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect password"
         )
     
-    hashed_password = get_password_hash(password_update.new_password)
+    hashed_password = await get_password_hash_async(password_update.new_password)
     user = user_repository.update(
         db,
         db_obj=current_user,
@@ -136,10 +140,7 @@ async def update_password(
         hashed_password=hashed_password,
         password_updated_at=datetime.now(timezone.utc)
     )
-    # Add permissions to the response
-    user_dict = user.__dict__.copy()
-    user_dict["permissions"] = user.get_permissions()
-    return user_dict
+    return _user_response(user)
 
 @router.get("/", response_model=UserList)
 @require_permission(Permission.READ_USERS)
@@ -24,8 +24,16 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
+    # PEM public key for asymmetric algorithms (e.g. EdDSA); derived from
+    # JWT_SECRET_KEY when unset
+    JWT_PUBLIC_KEY: Optional[str] = None
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
 
+    # Password Hashing (Argon2id; bcrypt hashes are verified and upgraded on login)
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+
     # PostgreSQL Database
     POSTGRES_SERVER: str
     POSTGRES_PORT: int = 5432
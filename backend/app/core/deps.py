@@ -1,9 +1,10 @@
-from typing import Generator, Optional
+from typing import Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from jwt import InvalidTokenError
 from sqlalchemy.orm import Session
-from app.core.security import ALGORITHM
+from app.core import jwt_cache
+from app.core.security import decode_access_token
 from app.db.session import SessionLocal
 from app.models.user import User
 from app.repositories.user import user_repository
@@ -31,19 +32,18 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt_cache.verify_cached(token, decode_access_token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
     
+    # FastAPI already resolves this dependency once per request, and the
+    # user was just loaded, so no refresh is needed
     user = user_repository.get_by_email(db, email=email)
     if user is None:
         raise credentials_exception
-    
-    # Ensure we have a fresh user object from the database
-    db.refresh(user)
     return user
 
 async def get_current_active_user(
@@ -0,0 +1,31 @@
+"""Short-lived cache of verified JWT payloads."""
+import hashlib
+import threading
+import time
+from typing import Callable
+
+from cachetools import TTLCache
+
+# Kept short so revoked or re-issued tokens drop out quickly
+TOKEN_CACHE_TTL_SECONDS = 5
+
+_cache: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+def verify_cached(token: str, verify: Callable[[str], dict]) -> dict:
+    """Return the payload for a token, verifying it only on a cache miss.
+
+    Cached payloads are still rejected once their exp has passed. Keys are
+    SHA-256 digests, so raw tokens are never held in memory by the cache.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    with _lock:
+        payload = _cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = verify(token)
+    with _lock:
+        _cache[key] = payload
+    return payload
@@ -23,6 +23,14 @@ class Permission(str, Enum):
         """Validate if a permission name is valid."""
         return permission_name in [p.value for p in cls]
 
+# Permission name -> (action, module, description) for its permissions row
+PERMISSION_DETAILS = {
+    Permission.API_ACCESS.value: ("access", "api", "Access the API"),
+    Permission.READ_USERS.value: ("read", "users", "Read user data"),
+    Permission.WRITE_USERS.value: ("write", "users", "Modify user data"),
+    Permission.MANAGE_USERS.value: ("manage", "users", "Manage users and permissions"),
+}
+
 def require_permission(permission: Permission):
     """Decorator to require a specific permission."""
     def decorator(func: Callable):
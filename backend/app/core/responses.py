@@ -0,0 +1,12 @@
+from typing import Any
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response that serializes pydantic models in a single pass."""
+
+    def render(self, content: Any) -> bytes:
+        """Render content, using pydantic-core's JSON writer for models."""
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode("utf-8")
+        return super().render(content)
@@ -1,12 +1,24 @@
-from datetime import datetime, timedelta
+import asyncio
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Optional, Union
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import jwt
+import orjson
+from jwt import InvalidTokenError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
 from app.config.settings import get_settings
+from app.core import jwt_cache
 from app.db.session import get_db
 from app.models.user import User
 from app.repositories.user import user_repository
@@ -14,19 +26,102 @@ from app.repositories.user import user_repository
 settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # JWT settings
 ALGORITHM = settings.JWT_ALGORITHM
+DEFAULT_TOKEN_EXPIRE_SECONDS = 15 * 60
+TIME_CLAIMS = ("exp", "iat", "nbf")
+
+# For asymmetric algorithms this parses the PEM keys once instead of on
+# every encode/decode; the secret is a private key, and verification uses
+# JWT_PUBLIC_KEY when set, otherwise the private key's public half. PyJWT
+# still runs prepare_key on each call, so for HMAC (the HS256 default) the
+# bytes conversion and PEM/SSH check are repeated per call either way.
+_jwt_algorithm = jwt.get_algorithm_by_name(ALGORITHM)
+_SIGNING_KEY = _jwt_algorithm.prepare_key(settings.JWT_SECRET_KEY)
+if settings.JWT_PUBLIC_KEY:
+    _VERIFYING_KEY = _jwt_algorithm.prepare_key(settings.JWT_PUBLIC_KEY)
+elif hasattr(_SIGNING_KEY, "public_key"):
+    _VERIFYING_KEY = _SIGNING_KEY.public_key()
+else:
+    _VERIFYING_KEY = _SIGNING_KEY
+
+# New hashes use Argon2id; bcrypt is kept only to verify legacy hashes
+_argon2 = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+ARGON2_PREFIX = "$argon2"
+
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_BYTES = 72
+# $2b$12$ followed by a 22-character salt and 31-character digest
+_BCRYPT_HASH_RE = re.compile(r"\$2[abxy]\$\d{2}\$[./A-Za-z0-9]{53}\Z")
+
+# argon2 and bcrypt release the GIL, so hashes run in parallel up to the
+# CPU count. Every hash takes a slot, whichever thread it runs on, which
+# also caps Argon2's per-hash memory; sync endpoints run on FastAPI's much
+# larger threadpool and would otherwise hash on all of its threads at once.
+HASH_CONCURRENCY = os.cpu_count() or 1
+_hash_slots = threading.BoundedSemaphore(HASH_CONCURRENCY)
+
+# Async callers hash on this pool, keeping the work off the event loop
+# without taking threads from the one FastAPI runs sync endpoints on
+_hash_pool = ThreadPoolExecutor(max_workers=HASH_CONCURRENCY, thread_name_prefix="password-hash")
+
+def _password_bytes(password: str) -> bytes:
+    """Encode a password into the bytes bcrypt actually uses."""
+    return password.encode("utf-8")[:BCRYPT_MAX_BYTES]
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against an Argon2id or legacy bcrypt hash."""
+    with _hash_slots:
+        if hashed_password.startswith(ARGON2_PREFIX):
+            try:
+                return _argon2.verify(hashed_password, plain_password)
+            except (VerificationError, InvalidHashError):
+                return False
+        # bcrypt panics (a BaseException) on some malformed hashes rather
+        # than raising ValueError, so check the format up front
+        if not _BCRYPT_HASH_RE.match(hashed_password):
+            return False
+        try:
+            return bcrypt.checkpw(_password_bytes(plain_password), hashed_password.encode("utf-8"))
+        except ValueError:
+            return False
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash is legacy bcrypt or uses outdated Argon2 parameters."""
+    if not hashed_password.startswith(ARGON2_PREFIX):
+        return True
+    try:
+        return _argon2.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return False
 
 def get_password_hash(password: str) -> str:
-    """Generate password hash."""
-    return pwd_context.hash(password)
+    """Generate an Argon2id password hash."""
+    with _hash_slots:
+        return _argon2.hash(password)
+
+@lru_cache(maxsize=1)
+def dummy_password_hash() -> str:
+    """Hash verified against when a login has no password to check.
+
+    An unknown email then takes as long to reject as a wrong password.
+    Built on first use so importing this module doesn't run a full hash.
+    """
+    return get_password_hash("dummy-password")
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_pool, verify_password, plain_password, hashed_password
+    )
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate a password hash off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, get_password_hash, password)
 
 def create_access_token(
     data: dict,
@@ -34,14 +129,33 @@ def create_access_token(
 ) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
+    # JWT exp is integer seconds since the epoch; skip the datetime round-trip
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expires_in = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=ALGORITHM)
+        expires_in = DEFAULT_TOKEN_EXPIRE_SECONDS
+    to_encode["exp"] = int(time.time()) + expires_in
+    # Signing the payload bytes directly skips PyJWT's claim handling, which
+    # would turn datetime iat/nbf into ints; orjson would write them as
+    # strings that fail verification later, so refuse them here.
+    for claim in TIME_CLAIMS:
+        if claim in to_encode and not isinstance(to_encode[claim], int):
+            raise TypeError(f"JWT '{claim}' claim must be int seconds since the epoch")
+    # Serialize the claims with orjson, which skips the stdlib json encoder.
+    # Unlike jwt.encode() it writes non-ASCII as raw UTF-8 rather than \u
+    # escapes, so the token bytes can differ but decode to the same claims.
+    encoded_jwt = jwt.api_jws.encode(
+        orjson.dumps(to_encode), _SIGNING_KEY, algorithm=ALGORITHM
+    )
     return encoded_jwt
 
+def decode_access_token(token: str) -> dict:
+    """Decode and verify a JWT access token.
+
+    Raises InvalidTokenError if the signature or expiry check fails.
+    """
+    return jwt.decode(token, _VERIFYING_KEY, algorithms=[ALGORITHM])
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -53,11 +167,11 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt_cache.verify_cached(token, decode_access_token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
     
     user = user_repository.get_by_email(db, email=email)
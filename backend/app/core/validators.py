@@ -1,7 +1,13 @@
 """Validation utilities for auth and user data."""
 import re
-from typing import Any
-from pydantic import validator
+from typing import Annotated, Any
+from pydantic import AfterValidator, EmailStr, StringConstraints, validator
+
+_SPECIAL_CHARS = r"[!@#$%^&*(),.?\":{}|<>]"
+# Every rule in one pass; the per-rule checks only run to explain a failure
+_STRONG_PASSWORD_RE = re.compile(
+    r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*" + _SPECIAL_CHARS + r").{8,}", re.DOTALL
+)
 
 def validate_password_strength(password: str) -> str:
     """Validate password strength.
@@ -13,6 +19,8 @@ def validate_password_strength(password: str) -> str:
     - At least one number
     - At least one special character
     """
+    if _STRONG_PASSWORD_RE.match(password):
+        return password
     if len(password) < 8:
         raise ValueError("Password must be at least 8 characters long")
     if not re.search(r"[A-Z]", password):
@@ -21,7 +29,7 @@ def validate_password_strength(password: str) -> str:
         raise ValueError("Password must contain at least one lowercase letter")
     if not re.search(r"\d", password):
         raise ValueError("Password must contain at least one number")
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+    if not re.search(_SPECIAL_CHARS, password):
         raise ValueError("Password must contain at least one special character")
     return password
 
@@ -53,4 +61,19 @@ def validate_pagination_params(page: int, size: int) -> tuple[int, int]:
         raise ValueError("Page size must be greater than 0")
     if size > 100:
         raise ValueError("Page size cannot be greater than 100")
-    return page, size 
\ No newline at end of file
+    return page, size 
+
+# Annotated field types. Length and character-set rules are expressed as
+# constraints so they run inside pydantic-core; only checks the core regex
+# engine cannot express (look-ahead character-class rules, the stricter
+# email pattern) fall back to the Python validators above.
+Email = Annotated[EmailStr, AfterValidator(validate_email_format)]
+
+# Validated in Python so users keep the specific full-name error messages
+FullName = Annotated[str, AfterValidator(validate_full_name)]
+
+Password = Annotated[
+    str,
+    StringConstraints(min_length=8, max_length=100),
+    AfterValidator(validate_password_strength)
+]
@@ -8,19 +8,12 @@ from app.models.user import User, UserRole
 from app.models.password import Password
 from app.models.permission import Permission
 from app.models.user_permission import UserPermission
+from app.core.permissions import PERMISSION_DETAILS
 from app.core.security import get_password_hash
 
 from alembic.config import Config
 from alembic import command 
 
-# Default permissions
-PERMISSIONS = [
-    ("api_access", "Access the API"),
-    ("read_users", "Read user data"),
-    ("write_users", "Modify user data"),
-    ("manage_users", "Manage users and permissions"),
-]
-
 # Admin user defaults
 ADMIN_EMAIL = "admin@example.com"
 ADMIN_PASSWORD = "admin123"
@@ -34,16 +27,16 @@ def get_db_session():
     return SessionLocal()
 
 def hash_password(password: str) -> str:
-    """Hash a password using passlib."""
+    """Hash a password using Argon2id."""
     return get_password_hash(password)
 
 def seed_permissions(session) -> list:
     """Seed default permissions and return the permission objects."""
     permission_objs = []
-    for name, desc in PERMISSIONS:
+    for name, (action, module, desc) in PERMISSION_DETAILS.items():
         perm = session.query(Permission).filter_by(name=name).first()
         if not perm:
-            perm = Permission(id=uuid.uuid4(), name=name, description=desc)
+            perm = Permission(id=uuid.uuid4(), name=name, action=action, module=module, description=desc)
             session.add(perm)
         permission_objs.append(perm)
     session.commit()
@@ -15,6 +15,8 @@ from app.core.handlers import (
     base_not_found_handler
 )
 from app.core.middleware import setup_middleware
+from app.db.session import SessionLocal
+from app.services.auth import AuthService
 from app.core.exceptions import (
     LexiReportException,
     ValidationException,
@@ -79,6 +81,18 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": errors}
     )
 
+@app.on_event("startup")
+def load_permissions():
+    """Warm the permission cache so registrations skip the lookup."""
+    db = SessionLocal()
+    try:
+        AuthService.init_permissions(db)
+    except Exception as e:
+        # Not fatal: the cache fills on first use instead
+        logger.warning(f"Could not preload permissions: {str(e)}")
+    finally:
+        db.close()
+
 @app.get("/")
 def root():
     """Redirect to API documentation."""
@@ -38,10 +38,12 @@ class AuditLog(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Add indexes for common queries
+    # Filter columns lead and created_at trails, so "latest N" lookups
+    # read straight off the index without a sort
     __table_args__ = (
-        Index('idx_audit_log_user', 'user_id'),
-        Index('idx_audit_log_entity', 'entity_type', 'entity_id'),
-        Index('idx_audit_log_action', 'action'),
+        Index('idx_audit_log_user_created', 'user_id', created_at.desc()),
+        Index('idx_audit_log_entity_created', 'entity_type', 'entity_id', created_at.desc()),
+        Index('idx_audit_log_action_created', 'action', created_at.desc()),
         Index('idx_audit_log_created', 'created_at'),
     )
 
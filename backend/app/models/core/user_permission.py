@@ -1,5 +1,5 @@
 from typing import Optional
-from sqlalchemy import ForeignKey, DateTime
+from sqlalchemy import ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 from sqlalchemy.dialects.postgresql import UUID
@@ -24,5 +24,10 @@ class UserPermission(Base):
     permission: Mapped["Permission"] = relationship("Permission", back_populates="user_permissions")
     granter: Mapped[Optional["User"]] = relationship("User", foreign_keys=[granted_by])
 
+    # A permission is granted to a user at most once
+    __table_args__ = (
+        UniqueConstraint('user_id', 'permission_id', name='uq_user_permission'),
+    )
+
     def __repr__(self) -> str:
         return f"<UserPermission {self.user_id}:{self.permission_id}>" 
\ No newline at end of file
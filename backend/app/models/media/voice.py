@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 import uuid
 
-from sqlalchemy import String, ForeignKey, Float, JSON, Column, Integer, DateTime, Boolean
+from sqlalchemy import String, ForeignKey, Float, JSON, Column, Integer, DateTime, Boolean, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -45,6 +45,12 @@ class AudioCache(Base):
     content_hash: Mapped[str] = mapped_column(String, nullable=False)
     audio_path: Mapped[str] = mapped_column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    # The same text is cached once per voice profile; the constraint's index
+    # serves the (profile, hash) lookup before synthesis
+    __table_args__ = (
+        UniqueConstraint("voice_profile_id", "content_hash", name="uq_audio_cache_profile_hash"),
+    )
     
     # Relationships
     voice_profile: Mapped["VoiceProfile"] = relationship("VoiceProfile", back_populates="audio_cache")
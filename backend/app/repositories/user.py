@@ -1,5 +1,6 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from typing import Optional, List, Tuple
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, selectinload
 from app.repositories.base import BaseRepository
 from app.models.user import User, UserRole
 from app.models.password import Password
@@ -24,6 +25,7 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         is_active: bool = True
     ) -> User:
         """Create a new user."""
+        now = datetime.now(timezone.utc)
         # Create user
         db_obj = User(
             id=uuid.uuid4(),
@@ -31,8 +33,8 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             full_name=obj_in.full_name,
             is_active=is_active,
             role=role,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+            created_at=now,
+            updated_at=now
         )
         db.add(db_obj)
         db.flush()  # Flush to get the user ID
@@ -42,9 +44,9 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             id=uuid.uuid4(),
             user_id=db_obj.id,
             hashed_password=hashed_password,
-            password_updated_at=datetime.now(timezone.utc),
+            password_updated_at=now,
             is_current=True,
-            created_at=datetime.now(timezone.utc)
+            created_at=now
         )
         db.add(password)
         db.commit()
@@ -66,11 +68,12 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         and marks the old one as not current.
         """
         update_data = obj_in.dict(exclude_unset=True)
+        now = datetime.now(timezone.utc)
         
         # Update user data
         for field in update_data:
             setattr(db_obj, field, update_data[field])
-        db_obj.updated_at = datetime.now(timezone.utc)
+        db_obj.updated_at = now
         
         # Handle password update if provided
         if hashed_password:
@@ -88,9 +91,9 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
                 id=uuid.uuid4(),
                 user_id=db_obj.id,
                 hashed_password=hashed_password,
-                password_updated_at=password_updated_at or datetime.now(timezone.utc),
+                password_updated_at=password_updated_at or now,
                 is_current=True,
-                created_at=datetime.now(timezone.utc)
+                created_at=now
             )
             db.add(new_password)
         
@@ -111,6 +114,20 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         """Count total users."""
         return db.query(self.model).count()
 
+    def get_with_current_password(
+        self, db: Session, *, email: str
+    ) -> Optional[Tuple[User, Optional[Password]]]:
+        """Get a user and their current password in a single query.
+
+        Permissions are loaded alongside, since login puts them in the token.
+        """
+        return db.query(User, Password).options(
+            selectinload(User.permissions)
+        ).outerjoin(
+            Password,
+            and_(Password.user_id == User.id, Password.is_current == True)
+        ).filter(User.email == email).first()
+
     def get_current_password(self, db: Session, user_id: uuid.UUID) -> Optional[Password]:
         """Get user's current password."""
         return db.query(Password).filter(
@@ -1,10 +1,20 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, UUID4
+
+# Shared model configurations; reference these instead of re-declaring them.
+# Validators are built on first use, so schemas a process never touches
+# don't pay the build cost at import.
+ORM_CONFIG = ConfigDict(from_attributes=True, defer_build=True)
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
+
+class IDSchema(BaseSchema):
+    """Schema with a UUID primary key."""
+    id: UUID4
 
 class TimestampSchema(BaseSchema):
     """Schema with timestamp fields."""
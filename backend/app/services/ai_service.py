@@ -1,10 +1,16 @@
 import os
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from fastapi import HTTPException
-import json
+import hashlib
+import orjson
 import logging
 from datetime import datetime
 
+from openpyxl import load_workbook
+
 from app.config.ai_settings import get_ai_settings
 from app.models.report import Report, ReportInsight
 from app.schemas.report import InsightCreate
@@ -12,6 +18,36 @@ from app.schemas.report import InsightCreate
 settings = get_ai_settings()
 logger = logging.getLogger(__name__)
 
+# Content shorter than this is returned as its own summary
+SUMMARY_MIN_LENGTH = 30
+
+# Summaries keyed by (model, content digest). Module level so the cache is
+# shared by every AIService instance; routes create one per request.
+SUMMARY_CACHE_SIZE = 1024
+_summary_cache: "OrderedDict[tuple[str, bytes], str]" = OrderedDict()
+
+# Blocking file parsing runs here so it doesn't stall the event loop
+_io_pool = ThreadPoolExecutor(max_workers=settings.MAX_WORKERS, thread_name_prefix="ai-io")
+
+
+def _read_text_file(file_path: str) -> str:
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _read_workbook(file_path: str) -> str:
+    # Read-only mode streams rows instead of loading the whole workbook
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        return "\n".join(
+            ",".join("" if value is None else str(value) for value in row)
+            for sheet in workbook.worksheets
+            for row in sheet.iter_rows(values_only=True)
+        )
+    finally:
+        workbook.close()
+
+
 class AIService:
     """Service for AI-powered report analysis and insight generation."""
 
@@ -20,6 +56,7 @@ class AIService:
         self.cache_dir = settings.CACHE_DIR
         self.max_workers = settings.MAX_WORKERS
         self.batch_size = settings.BATCH_SIZE
+        self._pool = _io_pool
 
     async def process_report(self, report: Report) -> List[ReportInsight]:
         """Process a report and generate insights."""
@@ -48,8 +85,14 @@ class AIService:
                 return await self._read_pdf(report.file_path)
             elif report.file_type == "docx":
                 return await self._read_docx(report.file_path)
-            elif report.file_type in ["xlsx", "xls"]:
+            elif report.file_type == "xlsx":
                 return await self._read_excel(report.file_path)
+            elif report.file_type == "xls":
+                # openpyxl only reads the xlsx format
+                raise HTTPException(
+                    status_code=400,
+                    detail="Legacy .xls files are not supported; save the report as .xlsx"
+                )
             elif report.file_type == "csv":
                 return await self._read_csv(report.file_path)
             else:
@@ -57,6 +100,8 @@ class AIService:
                     status_code=400,
                     detail=f"Unsupported file type: {report.file_type}"
                 )
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error reading report content: {str(e)}")
             raise HTTPException(
@@ -71,7 +116,8 @@ class AIService:
     ) -> List[ReportInsight]:
         """Generate insights from report content."""
         insights = []
-        
+        generated_at = datetime.utcnow().isoformat()
+
         # Generate summary
         summary = await self._generate_summary(content)
         insights.append(
@@ -82,37 +128,37 @@ class AIService:
                 confidence_score=0.9,
                 metadata={
                     "model": "gpt-4",
-                    "generated_at": datetime.utcnow().isoformat()
+                    "generated_at": generated_at
                 }
             )
         )
 
         # Generate key points
-        key_points = await self._generate_key_points(content)
+        key_points = await self._generate_key_points(summary)
         insights.append(
             ReportInsight(
                 report_id=report.id,
                 insight_type="key_points",
-                content=json.dumps(key_points),
+                content=orjson.dumps(key_points).decode(),
                 confidence_score=0.85,
                 metadata={
                     "model": "gpt-4",
-                    "generated_at": datetime.utcnow().isoformat()
+                    "generated_at": generated_at
                 }
             )
         )
 
         # Generate recommendations
-        recommendations = await self._generate_recommendations(content)
+        recommendations = await self._generate_recommendations(summary)
         insights.append(
             ReportInsight(
                 report_id=report.id,
                 insight_type="recommendations",
-                content=json.dumps(recommendations),
+                content=orjson.dumps(recommendations).decode(),
                 confidence_score=0.8,
                 metadata={
                     "model": "gpt-4",
-                    "generated_at": datetime.utcnow().isoformat()
+                    "generated_at": generated_at
                 }
             )
         )
@@ -130,26 +176,47 @@ class AIService:
         raise NotImplementedError("DOCX reading not implemented")
 
     async def _read_excel(self, file_path: str) -> str:
-        """Read Excel file content."""
-        # TODO: Implement Excel reading
-        raise NotImplementedError("Excel reading not implemented")
+        """Read Excel file content as comma-separated rows."""
+        return await self._run_blocking(_read_workbook, file_path)
 
     async def _read_csv(self, file_path: str) -> str:
         """Read CSV file content."""
-        # TODO: Implement CSV reading
-        raise NotImplementedError("CSV reading not implemented")
+        # The content is already CSV text; no need to parse it
+        return await self._run_blocking(_read_text_file, file_path)
+
+    async def _run_blocking(self, func, *args):
+        """Run a blocking callable on the I/O pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
 
     async def _generate_summary(self, content: str) -> str:
-        """Generate a summary of the report content."""
+        """Generate a summary of the report content.
+
+        Results are cached by content digest, so identical reports are only
+        summarized once per process.
+        """
+        if len(content) < SUMMARY_MIN_LENGTH:
+            return content.strip()
+
+        key = (self.model_path, hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest())
+        summary = _summary_cache.get(key)
+        if summary is not None:
+            _summary_cache.move_to_end(key)
+            return summary
+
         # TODO: Implement summary generation using AI
-        return "Summary placeholder"
+        summary = "Summary placeholder"
+
+        _summary_cache[key] = summary
+        if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+        return summary
 
-    async def _generate_key_points(self, content: str) -> List[str]:
-        """Generate key points from the report content."""
+    async def _generate_key_points(self, summary: str) -> List[str]:
+        """Generate key points from the report summary."""
         # TODO: Implement key points generation using AI
         return ["Key point 1", "Key point 2"]
 
-    async def _generate_recommendations(self, content: str) -> List[str]:
-        """Generate recommendations based on the report content."""
+    async def _generate_recommendations(self, summary: str) -> List[str]:
+        """Generate recommendations based on the report summary."""
         # TODO: Implement recommendations generation using AI
         return ["Recommendation 1", "Recommendation 2"] 
\ No newline at end of file
@@ -1,14 +1,18 @@
-from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.security import verify_password, get_password_hash, password_needs_rehash, create_access_token, dummy_password_hash
 from app.repositories.user import user_repository
 from app.schemas.auth import UserCreate, UserLogin, Token
 from app.models.user import User, UserRole
 from app.models.permission import Permission as PermissionModel
 from app.models.user_permission import UserPermission
+from app.models.password import Password
 from app.config.settings import get_settings
 from app.core.exceptions import (
     DatabaseError,
@@ -16,40 +20,130 @@ from app.core.exceptions import (
     InvalidCredentialsError,
     InactiveUserError
 )
-from app.core.permissions import Permission
+from app.core.permissions import Permission, PERMISSION_DETAILS
 import uuid
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Built once so every call reuses the same cached compiled SQL
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_USERS_PAGE = select(User).offset(bindparam("skip")).limit(bindparam("limit"))
 
 class AuthService:
+    # Permission name -> id, shared by all instances. Permissions are
+    # effectively static; filled at startup and on first use of a new name.
+    _permission_ids: Dict[str, uuid.UUID] = {}
+
     def __init__(self, user_repository):
         self.user_repository = user_repository
 
+    @classmethod
+    def init_permissions(cls, db: Session) -> None:
+        """Preload the permission name -> id cache."""
+        cls._permission_ids.update(
+            db.execute(select(PermissionModel.name, PermissionModel.id)).tuples()
+        )
+
     @staticmethod
     def get_user(db: Session, user_id: uuid.UUID) -> Optional[User]:
-        return db.query(User).filter(User.id == user_id).first()
+        return db.execute(_USER_BY_ID, {"user_id": user_id}).scalars().first()
 
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
-        return db.query(User).filter(User.email == email).first()
+        return db.execute(_USER_BY_EMAIL, {"email": email}).scalars().first()
 
     @staticmethod
     def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-        return db.query(User).offset(skip).limit(limit).all()
-
-    def _create_user_permission(self, db: Session, user_id: uuid.UUID, permission_name: str) -> None:
-        """Create a user permission."""
-        permission = db.query(PermissionModel).filter(PermissionModel.name == permission_name).first()
-        if not permission:
-            raise ValueError(f"Permission {permission_name} does not exist")
-
-        user_permission = UserPermission(
-            id=uuid.uuid4(),
-            user_id=user_id,
-            permission_id=permission.id,
-            created_at=datetime.now(timezone.utc)
+        return list(db.execute(_USERS_PAGE, {"skip": skip, "limit": limit}).scalars())
+
+    @staticmethod
+    def _permission_row(name: str) -> dict:
+        """Build a permissions row for a known permission name."""
+        action, module, description = PERMISSION_DETAILS[name]
+        return {
+            "id": uuid.uuid4(),
+            "name": name,
+            "action": action,
+            "module": module,
+            "description": description
+        }
+
+    def _lookup_permission_ids(self, db: Session, permission_names: List[str]) -> Dict[str, uuid.UUID]:
+        """Fetch the ids of the named permissions that exist."""
+        return dict(
+            db.execute(
+                select(PermissionModel.name, PermissionModel.id)
+                .where(PermissionModel.name.in_(permission_names))
+            ).tuples()
         )
-        db.add(user_permission)
+
+    def _ensure_permissions(self, db: Session, permission_names: List[str]) -> Dict[str, uuid.UUID]:
+        """Create the named permissions in one statement.
+
+        Returns the ids of the rows actually inserted; names created
+        concurrently are skipped by ON CONFLICT and left out.
+        """
+        stmt = insert(PermissionModel).values(
+            [self._permission_row(name) for name in permission_names]
+        ).on_conflict_do_nothing(
+            index_elements=["name"]
+        ).returning(PermissionModel.name, PermissionModel.id)
+        return dict(db.execute(stmt).tuples())
+
+    def _get_permission_ids(
+        self, db: Session, permission_names: List[str], resolved: Dict[str, uuid.UUID]
+    ) -> List[uuid.UUID]:
+        """Resolve permission names to ids, creating any that don't exist yet.
+
+        Ids not already cached are added to ``resolved`` rather than the
+        cache; the caller caches them once its transaction commits, so a
+        rollback never leaves ids for rows that don't exist.
+        """
+        missing = [name for name in permission_names if name not in self._permission_ids]
+        if missing:
+            resolved.update(self._lookup_permission_ids(db, missing))
+            # Only names that don't exist yet need an insert
+            new = [name for name in missing if name not in resolved]
+            if new:
+                resolved.update(self._ensure_permissions(db, new))
+                # Lost an insert race; the rows exist now
+                raced = [name for name in new if name not in resolved]
+                if raced:
+                    resolved.update(self._lookup_permission_ids(db, raced))
+        ids = {**self._permission_ids, **resolved}
+        return [ids[name] for name in permission_names]
+
+    def _create_user_permissions(self, db: Session, user_id: uuid.UUID, permission_ids: List[uuid.UUID]) -> None:
+        """Grant permissions to a user with a single multi-row INSERT.
+
+        Duplicate grants are skipped by the database rather than probed for
+        first.
+        """
+        stmt = insert(UserPermission).values([
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "permission_id": permission_id,
+                "granted_at": func.now()
+            }
+            for permission_id in permission_ids
+        ]).on_conflict_do_nothing(index_elements=["user_id", "permission_id"])
+        db.execute(stmt)
+
+    def _rehash_password(self, db: Session, current_password: Password, password: str) -> None:
+        """Store a fresh hash of a verified password.
+
+        Best effort: the password was already verified, so a failed write is
+        logged and rolled back instead of failing the login.
+        """
+        try:
+            current_password.hashed_password = get_password_hash(password)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning(f"Could not upgrade password hash: {str(e)}")
 
     def register(self, db: Session, user_in: UserCreate) -> dict:
         """Register a new user."""
@@ -77,10 +171,13 @@ class AuthService:
                 Permission.WRITE_USERS.value  # Can update own user data
             ]
             
-            for permission in default_permissions:
-                self._create_user_permission(db, user.id, permission)
+            resolved: Dict[str, uuid.UUID] = {}
+            permission_ids = self._get_permission_ids(db, default_permissions, resolved)
+            self._create_user_permissions(db, user.id, permission_ids)
             
             db.commit()
+            # The permission rows are committed now, so their ids are safe to share
+            self._permission_ids.update(resolved)
             
             return {
                 "message": "Registration successful",
@@ -93,40 +190,48 @@ class AuthService:
     def login(self, db: Session, user_in: UserLogin) -> Token:
         """Authenticate user and return token."""
         try:
-            # Get user
-            user = self.user_repository.get_by_email(db, email=user_in.email)
-            if not user:
-                raise InvalidCredentialsError()
-            
-            # Get current password
-            current_password = self.user_repository.get_current_password(db, user.id)
+            # Get user and current password together
+            row = self.user_repository.get_with_current_password(db, email=user_in.email)
+            user, current_password = row if row else (None, None)
             if not current_password:
+                # Burn the same hashing time as a real check so response
+                # timing doesn't reveal which emails are registered
+                verify_password(user_in.password, dummy_password_hash())
                 raise InvalidCredentialsError()
             
             # Verify password
             if not verify_password(user_in.password, current_password.hashed_password):
                 raise InvalidCredentialsError()
-            
+
             # Check if user is active
             if not user.is_active:
                 raise InactiveUserError()
             
             # Create access token with role and permissions
+            role = user.role
+            permissions = user.get_permissions()
             access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
             access_token = create_access_token(
                 data={
                     "sub": user.email,
-                    "role": user.role.value,
-                    "permissions": user.get_permissions()
+                    "role": role.value,
+                    "permissions": permissions
                 },
                 expires_delta=access_token_expires
             )
+
+            # Upgrade legacy or outdated hashes while we have the plaintext.
+            # Done last: the commit expires the user, and everything the
+            # token needs has already been read.
+            if password_needs_rehash(current_password.hashed_password):
+                self._rehash_password(db, current_password, user_in.password)
             
-            return Token(
+            # Every field comes from the loaded user or the token we just minted
+            return Token.model_construct(
                 access_token=access_token,
                 token_type="bearer",
-                role=user.role,
-                permissions=user.get_permissions()
+                role=role,
+                permissions=permissions
             )
         except SQLAlchemyError as e:
             raise DatabaseError(f"Error during user login: {str(e)}") 
\ No newline at end of file
@@ -54,10 +54,10 @@ class UserService:
     def delete_user(self, db: Session, *, user_id: uuid.UUID) -> None:
         """Delete user."""
         try:
-            user = self.user_repository.get(db, id=user_id)
+            # remove() returns None when no row matched; avoids a separate lookup
+            user = self.user_repository.remove(db, id=user_id)
             if not user:
                 raise UserNotFoundError()
-            self.user_repository.remove(db, id=user_id)
         except SQLAlchemyError as e:
             raise DatabaseError(f"Error deleting user: {str(e)}")
 
@@ -0,0 +1,38 @@
+import pytest
+import time
+from unittest.mock import MagicMock
+from jwt import ExpiredSignatureError, InvalidTokenError
+from app.core import jwt_cache
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    jwt_cache._cache.clear()
+    yield
+    jwt_cache._cache.clear()
+
+def test_hit_skips_verify():
+    payload = {'sub': 'test@example.com', 'exp': int(time.time()) + 60}
+    verify = MagicMock(return_value=payload)
+    assert jwt_cache.verify_cached('token', verify) == payload
+    assert jwt_cache.verify_cached('token', verify) == payload
+    verify.assert_called_once_with('token')
+
+def test_expired_payload_is_reverified():
+    verify = MagicMock(return_value={'sub': 'test@example.com', 'exp': int(time.time()) - 1})
+    jwt_cache.verify_cached('token', verify)
+    # The cached payload has expired, so the token goes back through verify,
+    # which rejects it
+    verify.side_effect = ExpiredSignatureError('Signature has expired')
+    with pytest.raises(ExpiredSignatureError):
+        jwt_cache.verify_cached('token', verify)
+    assert verify.call_count == 2
+
+def test_failed_verification_is_not_cached():
+    verify = MagicMock(side_effect=InvalidTokenError('bad signature'))
+    with pytest.raises(InvalidTokenError):
+        jwt_cache.verify_cached('token', verify)
+    assert len(jwt_cache._cache) == 0
+    # A later attempt with the same token is verified again
+    with pytest.raises(InvalidTokenError):
+        jwt_cache.verify_cached('token', verify)
+    assert verify.call_count == 2
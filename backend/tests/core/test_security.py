@@ -0,0 +1,102 @@
+import pytest
+import threading
+import time
+import bcrypt
+from argon2 import PasswordHasher
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from app.core import security
+
+@pytest.fixture
+def cheap_argon2():
+    # Same algorithm, far less memory, so the suite doesn't pay 64 MiB a hash
+    hasher = PasswordHasher(time_cost=1, memory_cost=1024, parallelism=1)
+    with patch.object(security, '_argon2', hasher):
+        yield hasher
+
+def _bcrypt_hash(password: bytes) -> str:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=4)).decode('utf-8')
+
+def test_argon2_round_trip(cheap_argon2):
+    hashed = security.get_password_hash('Password1!')
+    assert hashed.startswith(security.ARGON2_PREFIX)
+    assert security.verify_password('Password1!', hashed)
+    assert not security.verify_password('wrong', hashed)
+
+def test_legacy_bcrypt_hash_verifies():
+    hashed = _bcrypt_hash(b'Password1!')
+    assert security.verify_password('Password1!', hashed)
+    assert not security.verify_password('wrong', hashed)
+
+def test_legacy_bcrypt_uses_first_72_bytes():
+    password = 'a' * 72 + 'tail'
+    hashed = _bcrypt_hash(password.encode('utf-8')[:72])
+    assert security.verify_password(password, hashed)
+    # bcrypt never saw the tail, so a different one still matches
+    assert security.verify_password('a' * 72 + 'other', hashed)
+    assert not security.verify_password('a' * 71, hashed)
+
+def test_malformed_hash_is_rejected(cheap_argon2):
+    assert not security.verify_password('Password1!', 'not-a-hash')
+    assert not security.verify_password('Password1!', '$2b$12$tooshort')
+    # Full-length bcrypt hashes cut short or with an unknown variant
+    hashed = _bcrypt_hash(b'Password1!')
+    assert not security.verify_password('Password1!', hashed[:-1])
+    assert not security.verify_password('Password1!', '$2z$' + hashed[4:])
+    assert not security.verify_password('Password1!', security.ARGON2_PREFIX + 'id$garbage')
+
+def test_dummy_password_hash_is_built_once(cheap_argon2):
+    security.dummy_password_hash.cache_clear()
+    try:
+        hashed = security.dummy_password_hash()
+        assert hashed.startswith(security.ARGON2_PREFIX)
+        assert security.dummy_password_hash() is hashed
+    finally:
+        # Don't leave the cheap test hash behind for other tests
+        security.dummy_password_hash.cache_clear()
+
+def test_password_needs_rehash(cheap_argon2):
+    assert security.password_needs_rehash(_bcrypt_hash(b'Password1!'))
+    old = PasswordHasher(time_cost=1, memory_cost=512, parallelism=1).hash('Password1!')
+    assert security.password_needs_rehash(old)
+    assert not security.password_needs_rehash(cheap_argon2.hash('Password1!'))
+
+@patch.object(security, '_hash_slots', threading.BoundedSemaphore(2))
+def test_hashing_is_capped_across_threads():
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def slow_hash(password):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return 'hashed'
+
+    # Sync callers on a large pool still share the hashing slots
+    with patch.object(security, '_argon2') as argon2:
+        argon2.hash.side_effect = slow_hash
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(security.get_password_hash, ['password'] * 16))
+    assert results == ['hashed'] * 16
+    assert peak == 2
+
+def test_access_token_round_trip():
+    token = security.create_access_token(
+        {'sub': 'tëst@example.com', 'role': 'user', 'permissions': ['api_access']},
+        expires_delta=timedelta(minutes=5)
+    )
+    payload = security.decode_access_token(token)
+    assert payload['sub'] == 'tëst@example.com'
+    assert payload['role'] == 'user'
+    assert payload['permissions'] == ['api_access']
+    assert 0 < payload['exp'] - time.time() <= 5 * 60
+
+def test_access_token_rejects_datetime_claims():
+    with pytest.raises(TypeError):
+        security.create_access_token({'sub': 'test@example.com', 'iat': datetime.now(timezone.utc)})
@@ -1,5 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
 from app.services.auth import AuthService
 from app.schemas.auth import UserCreate, UserLogin, Token
 from app.models.user import User, UserRole
@@ -16,18 +18,81 @@ def mock_user_repository():
     repo.get_by_email.return_value = None
     repo.create.return_value = MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=True, get_permissions=lambda: ['api_access', 'read_users', 'write_users'])
     repo.get_current_password.return_value = MagicMock(hashed_password='hashed')
+    repo.get_with_current_password.return_value = None
     return repo
 
 @pytest.fixture
 def auth_service(mock_user_repository):
     return AuthService(mock_user_repository)
 
+@patch.dict(AuthService._permission_ids, clear=True)
 @patch('app.services.auth.get_password_hash', return_value='hashed')
 def test_register_success(mock_hash, auth_service, mock_db, mock_user_repository):
+    mock_db.execute.return_value.tuples.return_value = [(name, uuid.uuid4()) for name in ('api_access', 'read_users', 'write_users')]
     user_in = UserCreate(email='test@example.com', full_name='Test User', password='Password1!')
     result = auth_service.register(mock_db, user_in)
     assert result['message'] == 'Registration successful'
     assert result['email'] == 'test@example.com'
+    # Cold cache: existing permissions are looked up by name, then granted
+    assert mock_db.execute.call_count == 2
+    # The password is hashed exactly once; the repository stores the hash as given
+    mock_hash.assert_called_once_with('Password1!')
+    assert mock_user_repository.create.call_args.kwargs['hashed_password'] == 'hashed'
+
+@patch.dict(AuthService._permission_ids, clear=True)
+@patch('app.services.auth.get_password_hash', return_value='hashed')
+def test_register_creates_missing_permissions(mock_hash, auth_service, mock_db, mock_user_repository):
+    existing = MagicMock()
+    existing.tuples.return_value = [(name, uuid.uuid4()) for name in ('api_access', 'read_users')]
+    inserted = MagicMock()
+    inserted.tuples.return_value = [('write_users', uuid.uuid4())]
+    mock_db.execute.side_effect = [existing, inserted, MagicMock()]
+    user_in = UserCreate(email='test@example.com', full_name='Test User', password='Password1!')
+    auth_service.register(mock_db, user_in)
+    # One lookup, one insert of only the missing name, one grant
+    assert mock_db.execute.call_count == 3
+    assert set(AuthService._permission_ids) == {'api_access', 'read_users', 'write_users'}
+    # The insert fills every NOT NULL column
+    params = mock_db.execute.call_args_list[1].args[0].compile(dialect=postgresql.dialect()).params
+    assert 'write_users' in params.values()
+    assert 'write' in params.values()
+    assert 'users' in params.values()
+    assert 'Modify user data' in params.values()
+    assert 'read_users' not in params.values()
+
+@patch.dict(AuthService._permission_ids, clear=True)
+@patch('app.services.auth.get_password_hash', return_value='hashed')
+def test_register_rollback_leaves_permission_cache_empty(mock_hash, auth_service, mock_db, mock_user_repository):
+    mock_db.execute.return_value.tuples.return_value = [(name, uuid.uuid4()) for name in ('api_access', 'read_users', 'write_users')]
+    mock_db.commit.side_effect = SQLAlchemyError('commit failed')
+    user_in = UserCreate(email='test@example.com', full_name='Test User', password='Password1!')
+    with pytest.raises(DatabaseError):
+        auth_service.register(mock_db, user_in)
+    # Nothing is cached until the registration commits
+    assert AuthService._permission_ids == {}
+
+@patch.dict(AuthService._permission_ids, clear=True)
+@patch('app.services.auth.get_password_hash', return_value='hashed')
+def test_register_rollback_drops_inserted_permission_ids(mock_hash, auth_service, mock_db, mock_user_repository):
+    existing = MagicMock()
+    existing.tuples.return_value = []
+    inserted = MagicMock()
+    inserted.tuples.return_value = [(name, uuid.uuid4()) for name in ('api_access', 'read_users', 'write_users')]
+    mock_db.execute.side_effect = [existing, inserted, MagicMock()]
+    mock_db.commit.side_effect = SQLAlchemyError('commit failed')
+    user_in = UserCreate(email='test@example.com', full_name='Test User', password='Password1!')
+    with pytest.raises(DatabaseError):
+        auth_service.register(mock_db, user_in)
+    # The inserted rows were rolled back, so their ids must not be cached
+    assert AuthService._permission_ids == {}
+
+@patch.dict(AuthService._permission_ids, {'api_access': uuid.uuid4(), 'read_users': uuid.uuid4(), 'write_users': uuid.uuid4()}, clear=True)
+@patch('app.services.auth.get_password_hash', return_value='hashed')
+def test_register_with_cached_permissions(mock_hash, auth_service, mock_db, mock_user_repository):
+    user_in = UserCreate(email='test@example.com', full_name='Test User', password='Password1!')
+    auth_service.register(mock_db, user_in)
+    # Warm cache: only the grant itself hits the database
+    mock_db.execute.assert_called_once()
 
 @patch('app.services.auth.get_password_hash', return_value='hashed')
 def test_register_user_already_exists(mock_hash, auth_service, mock_db, mock_user_repository):
@@ -38,27 +103,79 @@ def test_register_user_already_exists(mock_hash, auth_service, mock_db, mock_use
 
 @patch('app.services.auth.verify_password', return_value=True)
 @patch('app.services.auth.create_access_token', return_value='token')
-def test_login_success(mock_token, mock_verify, auth_service, mock_db, mock_user_repository):
-    mock_user_repository.get_by_email.return_value = MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=True, get_permissions=lambda: ['api_access'])
-    mock_user_repository.get_current_password.return_value = MagicMock(hashed_password='hashed')
+@patch('app.services.auth.password_needs_rehash', return_value=False)
+def test_login_success(mock_rehash, mock_token, mock_verify, auth_service, mock_db, mock_user_repository):
+    mock_user_repository.get_with_current_password.return_value = (MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=True, get_permissions=lambda: ['api_access']), MagicMock(hashed_password='hashed'))
     user_in = UserLogin(email='test@example.com', password='password')
     token = auth_service.login(mock_db, user_in)
     assert isinstance(token, Token)
     assert token.access_token == 'token'
     assert token.token_type == 'bearer'
 
+@patch('app.services.auth.get_password_hash', return_value='rehashed')
+@patch('app.services.auth.verify_password', return_value=True)
+@patch('app.services.auth.create_access_token', return_value='token')
+def test_login_rehashes_weaker_hash(mock_token, mock_verify, mock_hash, auth_service, mock_db, mock_user_repository):
+    current_password = MagicMock(hashed_password='$2b$04$' + 'a' * 53)
+    mock_user_repository.get_with_current_password.return_value = (MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=True, get_permissions=lambda: ['api_access']), current_password)
+    user_in = UserLogin(email='test@example.com', password='password')
+    auth_service.login(mock_db, user_in)
+    assert current_password.hashed_password == 'rehashed'
+    mock_db.commit.assert_called_once()
+
+@patch('app.services.auth.get_password_hash', return_value='rehashed')
+@patch('app.services.auth.verify_password', return_value=True)
+@patch('app.services.auth.create_access_token', return_value='token')
+def test_login_survives_failed_rehash(mock_token, mock_verify, mock_hash, auth_service, mock_db, mock_user_repository):
+    current_password = MagicMock(hashed_password='$2b$04$' + 'a' * 53)
+    mock_user_repository.get_with_current_password.return_value = (MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=True, get_permissions=lambda: ['api_access']), current_password)
+    mock_db.commit.side_effect = SQLAlchemyError('commit failed')
+    user_in = UserLogin(email='test@example.com', password='password')
+    # The password was correct, so the login still succeeds
+    token = auth_service.login(mock_db, user_in)
+    assert token.access_token == 'token'
+    mock_db.rollback.assert_called_once()
+
+@patch('app.services.auth.get_password_hash', return_value='rehashed')
+@patch('app.services.auth.verify_password', return_value=True)
+def test_login_inactive_user_skips_rehash(mock_verify, mock_hash, auth_service, mock_db, mock_user_repository):
+    current_password = MagicMock(hashed_password='$2b$04$' + 'a' * 53)
+    mock_user_repository.get_with_current_password.return_value = (MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=False, get_permissions=lambda: ['api_access']), current_password)
+    user_in = UserLogin(email='test@example.com', password='password')
+    with pytest.raises(InactiveUserError):
+        auth_service.login(mock_db, user_in)
+    mock_hash.assert_not_called()
+    mock_db.commit.assert_not_called()
+
 @patch('app.services.auth.verify_password', return_value=False)
 def test_login_invalid_password(mock_verify, auth_service, mock_db, mock_user_repository):
-    mock_user_repository.get_by_email.return_value = MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=True, get_permissions=lambda: ['api_access'])
-    mock_user_repository.get_current_password.return_value = MagicMock(hashed_password='hashed')
+    mock_user_repository.get_with_current_password.return_value = (MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=True, get_permissions=lambda: ['api_access']), MagicMock(hashed_password='hashed'))
     user_in = UserLogin(email='test@example.com', password='wrong')
     with pytest.raises(InvalidCredentialsError):
         auth_service.login(mock_db, user_in)
 
+@patch('app.services.auth.dummy_password_hash', return_value='dummy')
+@patch('app.services.auth.verify_password', return_value=True)
+def test_login_unknown_user_runs_dummy_verify(mock_verify, mock_dummy, auth_service, mock_db, mock_user_repository):
+    user_in = UserLogin(email='missing@example.com', password='password')
+    with pytest.raises(InvalidCredentialsError):
+        auth_service.login(mock_db, user_in)
+    mock_verify.assert_called_once_with('password', 'dummy')
+
+@patch('app.services.auth.dummy_password_hash', return_value='dummy')
+@patch('app.services.auth.verify_password', return_value=True)
+def test_login_user_without_password_runs_dummy_verify(mock_verify, mock_dummy, auth_service, mock_db, mock_user_repository):
+    mock_user_repository.get_with_current_password.return_value = (MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=True, get_permissions=lambda: ['api_access']), None)
+    user_in = UserLogin(email='test@example.com', password='password')
+    with pytest.raises(InvalidCredentialsError):
+        auth_service.login(mock_db, user_in)
+    # Same hashing time as an unknown email or a wrong password
+    mock_verify.assert_called_once_with('password', 'dummy')
+
 @patch('app.services.auth.verify_password', return_value=True)
-def test_login_inactive_user(mock_verify, auth_service, mock_db, mock_user_repository):
-    mock_user_repository.get_by_email.return_value = MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=False, get_permissions=lambda: ['api_access'])
-    mock_user_repository.get_current_password.return_value = MagicMock(hashed_password='hashed')
+@patch('app.services.auth.password_needs_rehash', return_value=False)
+def test_login_inactive_user(mock_rehash, mock_verify, auth_service, mock_db, mock_user_repository):
+    mock_user_repository.get_with_current_password.return_value = (MagicMock(id=uuid.uuid4(), email='test@example.com', role=UserRole.USER, is_active=False, get_permissions=lambda: ['api_access']), MagicMock(hashed_password='hashed'))
     user_in = UserLogin(email='test@example.com', password='password')
     with pytest.raises(InactiveUserError):
         auth_service.login(mock_db, user_in) 
\ No newline at end of file
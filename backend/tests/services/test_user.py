@@ -53,12 +53,13 @@ def test_update_user_not_found(user_service, mock_db, mock_user_repository):
 
 def test_delete_user_success(user_service, mock_db, mock_user_repository):
     user_id = uuid.uuid4()
-    mock_user_repository.get.return_value = MagicMock(id=user_id, email='test@example.com')
+    mock_user_repository.remove.return_value = MagicMock(id=user_id, email='test@example.com')
     user_service.delete_user(mock_db, user_id=user_id)
     mock_user_repository.remove.assert_called_once_with(mock_db, id=user_id)
+    mock_user_repository.get.assert_not_called()
 
 def test_delete_user_not_found(user_service, mock_db, mock_user_repository):
     user_id = uuid.uuid4()
-    mock_user_repository.get.return_value = None
+    mock_user_repository.remove.return_value = None
     with pytest.raises(UserNotFoundError):
         user_service.delete_user(mock_db, user_id=user_id) 
\ No newline at end of file